@@ -18,14 +18,14 @@
 
 import pathlib
 import subprocess
-import tempfile
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
-import gnupg
 from craft_cli import emit
 
 from . import apt_ppa, errors, package_repository
 
+_GPG_ENV: Dict[str, str] = {"LANG": "C.UTF-8"}
+
 
 class AptKeyManager:
     """Manage APT repository keys."""
@@ -40,6 +40,7 @@ class AptKeyManager:
     ) -> None:
         self._gpg_keyring = gpg_keyring
         self._key_assets = key_assets
+        self._installed_key_ids: Set[str] = set()
 
     def find_asset_with_key_id(self, *, key_id: str) -> Optional[pathlib.Path]:
         """Find snap key asset matching key_id.
@@ -63,30 +64,55 @@ class AptKeyManager:
     def get_key_fingerprints(cls, *, key: str) -> List[str]:
         """List fingerprints found in specified key.
 
-        Do this by importing the key into a temporary keyring,
-        then querying the keyring for fingerprints.
+        Do this by asking gpg to show the key without importing it,
+        then parsing the fingerprints of the primary keys from its
+        machine-readable output.
 
         :param key: Key data (string) to parse.
 
         :returns: List of key fingerprints/IDs.
         """
-        with tempfile.NamedTemporaryFile(suffix="keyring") as temp_file:
-            return (
-                gnupg.GPG(keyring=temp_file.name).import_keys(key_data=key).fingerprints
+        try:
+            proc = subprocess.run(
+                ["gpg", "--batch", "--show-keys", "--with-colons"],
+                input=key.encode(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=True,
             )
-
-    @classmethod
-    def is_key_installed(cls, *, key_id: str) -> bool:
+        except subprocess.CalledProcessError as error:
+            emit.debug(f"Unable to read key fingerprints: {error.stderr!r}")
+            return []
+
+        fingerprints = []
+        record_type = ""
+        for line in proc.stdout.decode().splitlines():
+            fields = line.split(":")
+            # Only take the fingerprint following a public key record,
+            # skipping those of subkeys.
+            if fields[0] == "fpr" and record_type == "pub":
+                fingerprints.append(fields[9])
+            record_type = fields[0]
+
+        return fingerprints
+
+    def is_key_installed(self, *, key_id: str) -> bool:
         """Check if specified key_id is installed.
 
         Check if key is installed by attempting to export the key.
         Unfortunately, apt-key does not exit with error and
         we have to do our best to parse the output.
 
+        Keys found to be installed are remembered, so that subsequent
+        checks for the same key_id do not call apt-key again.
+
         :param key_id: Key ID to check for.
 
         :returns: True if key is installed.
         """
+        if key_id.upper() in self._installed_key_ids:
+            return True
+
         try:
             proc = subprocess.run(
                 ["apt-key", "export", key_id],
@@ -103,6 +129,7 @@ class AptKeyManager:
         apt_key_output = proc.stdout.decode()
 
         if "BEGIN PGP PUBLIC KEY BLOCK" in apt_key_output:
+            self._installed_key_ids.add(key_id.upper())
             return True
 
         if "nothing exported" in apt_key_output:
@@ -131,15 +158,13 @@ class AptKeyManager:
 
         try:
             emit.debug(f"Executing: {cmd!r}")
-            env = {}
-            env["LANG"] = "C.UTF-8"
             subprocess.run(
                 cmd,
                 input=key.encode(),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 check=True,
-                env=env,
+                env=_GPG_ENV,
             )
         except subprocess.CalledProcessError as error:
             raise errors.AptGPGKeyInstallError(error.output.decode(), key=key)
@@ -156,9 +181,6 @@ class AptKeyManager:
 
         :raises: AptGPGKeyInstallError if unable to install key.
         """
-        env = {}
-        env["LANG"] = "C.UTF-8"
-
         cmd = [
             "apt-key",
             "--keyring",
@@ -177,13 +199,15 @@ class AptKeyManager:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 check=True,
-                env=env,
+                env=_GPG_ENV,
             )
         except subprocess.CalledProcessError as error:
             raise errors.AptGPGKeyInstallError(
                 error.output.decode(), key_id=key_id, key_server=key_server
             )
 
+        self._installed_key_ids.add(key_id.upper())
+
     def install_package_repository_key(
         self, *, package_repo: package_repository.PackageRepository
     ) -> bool:
@@ -218,6 +242,7 @@ class AptKeyManager:
         key_path = self.find_asset_with_key_id(key_id=key_id)
         if key_path is not None:
             self.install_key(key=key_path.read_text())
+            self._installed_key_ids.add(key_id.upper())
         else:
             if key_server is None:
                 key_server = "keyserver.ubuntu.com"
@@ -90,9 +90,7 @@ class QmakePlugin(PluginV1):
         elif self.options.qt_version == "qt4":
             self.build_packages.extend(["qt4-qmake", "libqt4-dev"])
         else:
-            raise RuntimeError(
-                "Unsupported Qt version: {!r}".format(self.options.qt_version)
-            )
+            raise RuntimeError(f"Unsupported Qt version: {self.options.qt_version!r}")
 
     def build(self):
         super().build()
@@ -114,21 +112,23 @@ class QmakePlugin(PluginV1):
             ["qmake"] + self._extra_config() + self.options.options + sources, env=env
         )
 
-        self.run(["make", "-j{}".format(self.parallel_build_count)], env=env)
+        self.run(["make", f"-j{self.parallel_build_count}"], env=env)
 
-        self.run(["make", "install", "INSTALL_ROOT=" + self.installdir], env=env)
+        self.run(["make", "install", f"INSTALL_ROOT={self.installdir}"], env=env)
 
     def _extra_config(self):
         extra_config = []
+        arch_triplet = self.project.arch_triplet
 
-        for root in [self.installdir, self.project.stage_dir]:
-            paths = common.get_library_paths(root, self.project.arch_triplet)
-            for path in paths:
-                extra_config.append('LIBS+="-L{}"'.format(path))
-
-            paths = common.get_include_paths(root, self.project.arch_triplet)
-            for path in paths:
-                extra_config.append('INCLUDEPATH+="{}"'.format(path))
+        for root in (self.installdir, self.project.stage_dir):
+            extra_config.extend(
+                f'LIBS+="-L{path}"'
+                for path in common.get_library_paths(root, arch_triplet)
+            )
+            extra_config.extend(
+                f'INCLUDEPATH+="{path}"'
+                for path in common.get_include_paths(root, arch_triplet)
+            )
 
         return extra_config
 
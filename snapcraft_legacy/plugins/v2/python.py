@@ -63,12 +63,51 @@ Use of python3-<python-package> in stage-packages will force the
 inclusion of the python interpreter.
 """
 
+import functools
 import shlex
 from textwrap import dedent
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 from snapcraft_legacy.plugins.v2 import PluginV2
 
+_SHEBANG_FIX_COMMAND = (
+    'find "${SNAPCRAFT_PART_INSTALL}" -type f -executable -exec '
+    'sed -i "1 s|^#\\!${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}.*$|#\\!/usr/bin/env ${SNAPCRAFT_PYTHON_INTERPRETER}|" {} +\n'
+)
+
+_SYMLINK_FIX_COMMAND = dedent(
+    """\
+    determine_link_target() {
+        opts_state="$(set +o +x | grep xtrace)"
+        interp_dir="$(dirname "${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}")"
+        # Determine python based on PATH, then resolve it, e.g:
+        # (1) /home/ubuntu/.venv/snapcraft/bin/python3 -> /usr/bin/python3.8
+        # (2) /usr/bin/python3 -> /usr/bin/python3.8
+        # (3) /root/stage/python3 -> /root/stage/python3.8
+        # (4) /root/parts/<part>/install/usr/bin/python3 -> /root/parts/<part>/install/usr/bin/python3.8
+        python_path="$(which "${SNAPCRAFT_PYTHON_INTERPRETER}")"
+        python_path="$(readlink -e "${python_path}")"
+        for dir in "${SNAPCRAFT_PART_INSTALL}" "${SNAPCRAFT_STAGE}"; do
+            if  echo "${python_path}" | grep -q "${dir}"; then
+                python_path="$(realpath --strip --relative-to="${interp_dir}" \\
+                        "${python_path}")"
+                break
+            fi
+        done
+        echo "${python_path}"
+        eval "${opts_state}"
+    }
+
+    python_path="$(determine_link_target)"
+    ln -sf "${python_path}" "${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}"
+    """
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _quote_packages(packages: Tuple[str, ...]) -> str:
+    return " ".join(map(shlex.quote, packages))
+
 
 class PythonPlugin(PluginV2):
     @classmethod
@@ -123,20 +162,20 @@ class PythonPlugin(PluginV2):
             'SNAPCRAFT_PYTHON_VENV_INTERP_PATH="${SNAPCRAFT_PART_INSTALL}/bin/${SNAPCRAFT_PYTHON_INTERPRETER}"',
         ]
 
-        if self.options.constraints:
-            constraints = " ".join(f"-c {c!r}" for c in self.options.constraints)
+        options = self.options
+
+        if options.constraints:
+            constraints = " ".join(f"-c {c!r}" for c in options.constraints)
         else:
             constraints = ""
 
-        if self.options.python_packages:
-            python_packages = " ".join(
-                [shlex.quote(pkg) for pkg in self.options.python_packages]
-            )
+        if options.python_packages:
+            python_packages = _quote_packages(tuple(options.python_packages))
             python_packages_cmd = f"pip install {constraints} -U {python_packages}"
             build_commands.append(python_packages_cmd)
 
-        if self.options.requirements:
-            requirements = " ".join(f"-r {r!r}" for r in self.options.requirements)
+        if options.requirements:
+            requirements = " ".join(f"-r {r!r}" for r in options.requirements)
             requirements_cmd = f"pip install {constraints} -U {requirements}"
             build_commands.append(requirements_cmd)
 
@@ -145,45 +184,10 @@ class PythonPlugin(PluginV2):
         # Now fix shebangs.
         # TODO: replace with snapcraftctl once the two scripts are consolidated
         # and use mangling.rewrite_python_shebangs.
-        build_commands.append(
-            dedent(
-                """\
-            find "${SNAPCRAFT_PART_INSTALL}" -type f -executable -print0 | xargs -0 \
-                sed -i "1 s|^#\\!${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}.*$|#\\!/usr/bin/env ${SNAPCRAFT_PYTHON_INTERPRETER}|"
-            """
-            )
-        )
+        build_commands.append(_SHEBANG_FIX_COMMAND)
 
         # Lastly, fix the symlink to the "real" python3 interpreter.
         # TODO: replace with snapcraftctl (create_relative_symlinks).
-        build_commands.append(
-            dedent(
-                """\
-            determine_link_target() {
-                opts_state="$(set +o +x | grep xtrace)"
-                interp_dir="$(dirname "${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}")"
-                # Determine python based on PATH, then resolve it, e.g:
-                # (1) /home/ubuntu/.venv/snapcraft/bin/python3 -> /usr/bin/python3.8
-                # (2) /usr/bin/python3 -> /usr/bin/python3.8
-                # (3) /root/stage/python3 -> /root/stage/python3.8
-                # (4) /root/parts/<part>/install/usr/bin/python3 -> /root/parts/<part>/install/usr/bin/python3.8
-                python_path="$(which "${SNAPCRAFT_PYTHON_INTERPRETER}")"
-                python_path="$(readlink -e "${python_path}")"
-                for dir in "${SNAPCRAFT_PART_INSTALL}" "${SNAPCRAFT_STAGE}"; do
-                    if  echo "${python_path}" | grep -q "${dir}"; then
-                        python_path="$(realpath --strip --relative-to="${interp_dir}" \\
-                                "${python_path}")"
-                        break
-                    fi
-                done
-                echo "${python_path}"
-                eval "${opts_state}"
-            }
-
-            python_path="$(determine_link_target)"
-            ln -sf "${python_path}" "${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}"
-            """
-            )
-        )
+        build_commands.append(_SYMLINK_FIX_COMMAND)
 
         return build_commands
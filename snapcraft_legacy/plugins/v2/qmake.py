@@ -80,9 +80,7 @@ class QMakePlugin(PluginV2):
 
         if self.options.qmake_project_file:
             cmd.append(
-                '"${{SNAPCRAFT_PART_SRC_WORK}}/{}"'.format(
-                    self.options.qmake_project_file
-                )
+                f'"${{SNAPCRAFT_PART_SRC_WORK}}/{self.options.qmake_project_file}"'
             )
         else:
             cmd.append('"${SNAPCRAFT_PART_SRC_WORK}"')
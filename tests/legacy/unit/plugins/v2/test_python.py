@@ -64,11 +64,9 @@ def test_get_build_environment():
 
 
 _FIXUP_BUILD_COMMANDS = [
-    dedent(
-        """\
-            find "${SNAPCRAFT_PART_INSTALL}" -type f -executable -print0 | xargs -0 \
-                sed -i "1 s|^#\\!${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}.*$|#\\!/usr/bin/env ${SNAPCRAFT_PYTHON_INTERPRETER}|"
-            """
+    (
+        'find "${SNAPCRAFT_PART_INSTALL}" -type f -executable -exec '
+        'sed -i "1 s|^#\\!${SNAPCRAFT_PYTHON_VENV_INTERP_PATH}.*$|#\\!/usr/bin/env ${SNAPCRAFT_PYTHON_INTERPRETER}|" {} +\n'
     ),
     dedent(
         """\
@@ -16,10 +16,8 @@
 
 
 import subprocess
-from unittest import mock
 from unittest.mock import call
 
-import gnupg
 import pytest
 
 from snapcraft.repo import apt_ppa, errors
@@ -35,13 +33,6 @@ def mock_environ_copy(mocker):
     yield mocker.patch("os.environ.copy")
 
 
-@pytest.fixture(autouse=True)
-def mock_gnupg(tmp_path, mocker):
-    m = mocker.patch("gnupg.GPG", spec=gnupg.GPG)
-    m.return_value.import_keys.return_value.fingerprints = ["FAKE-KEY-ID-FROM-GNUPG"]
-    yield m
-
-
 @pytest.fixture(autouse=True)
 def mock_run(mocker):
     yield mocker.patch("subprocess.run", spec=subprocess.run)
@@ -99,19 +90,46 @@ def test_find_asset_none(
 
 def test_get_key_fingerprints(
     apt_gpg,
-    mock_gnupg,
+    mock_run,
 ):
-    with mock.patch("tempfile.NamedTemporaryFile") as m:
-        m.return_value.__enter__.return_value.name = "/tmp/foo"
-        ids = apt_gpg.get_key_fingerprints(key="8" * 40)
-
-    assert ids == ["FAKE-KEY-ID-FROM-GNUPG"]
-    assert mock_gnupg.mock_calls == [
-        call(keyring="/tmp/foo"),
-        call().import_keys(key_data="8888888888888888888888888888888888888888"),
+    mock_run.return_value.stdout = (
+        b"pub:-:4096:1:F1831DDAFC42E99D:1416490823:::-:::scSC::::::23:\n"
+        b"fpr:::::::::78E1918602959B9C59103100F1831DDAFC42E99D:\n"
+        b"uid:-::::1416490823::DCB9EEE37DC9FD84C3DB333BFBF6C41A075EEF6D::fake:\n"
+        b"sub:-:4096:1:1D1E1E1E1E1E1E1E:1416490823::::::e::::::23:\n"
+        b"fpr:::::::::AAAAAAAAAAAAAAAAAAAAAAAA1D1E1E1E1E1E1E1E:\n"
+        b"pub:-:4096:1:8888888888888888:1416490823:::-:::scSC::::::23:\n"
+        b"fpr:::::::::8888888888888888888888888888888888888888:\n"
+    )
+
+    ids = apt_gpg.get_key_fingerprints(key="FAKEKEY")
+
+    assert ids == [
+        "78E1918602959B9C59103100F1831DDAFC42E99D",
+        "8888888888888888888888888888888888888888",
+    ]
+    assert mock_run.mock_calls == [
+        call(
+            ["gpg", "--batch", "--show-keys", "--with-colons"],
+            input=b"FAKEKEY",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
     ]
 
 
+def test_get_key_fingerprints_with_gpg_failure(
+    apt_gpg,
+    mock_run,
+):
+    mock_run.side_effect = subprocess.CalledProcessError(
+        cmd=["gpg"], returncode=2, stderr=b"no valid OpenPGP data found"
+    )
+
+    assert apt_gpg.get_key_fingerprints(key="FAKEKEY") == []
+
+
 @pytest.mark.parametrize(
     "stdout,expected",
     [
@@ -141,6 +159,37 @@ def test_is_key_installed(
     ]
 
 
+def test_is_key_installed_caches_installed_keys(
+    apt_gpg,
+    mock_run,
+):
+    mock_run.return_value.stdout = b"BEGIN PGP PUBLIC KEY BLOCK"
+
+    assert apt_gpg.is_key_installed(key_id="foo") is True
+    assert apt_gpg.is_key_installed(key_id="FOO") is True
+
+    assert mock_run.mock_calls == [
+        call(
+            ["apt-key", "export", "foo"],
+            check=True,
+            stderr=subprocess.STDOUT,
+            stdout=subprocess.PIPE,
+        )
+    ]
+
+
+def test_is_key_installed_does_not_cache_missing_keys(
+    apt_gpg,
+    mock_run,
+):
+    mock_run.return_value.stdout = b"nothing exported"
+
+    assert apt_gpg.is_key_installed(key_id="foo") is False
+    assert apt_gpg.is_key_installed(key_id="foo") is False
+
+    assert len(mock_run.mock_calls) == 2
+
+
 def test_is_key_installed_with_apt_key_failure(
     apt_gpg,
     mock_run,
@@ -208,6 +257,13 @@ def test_install_key_from_keyserver(apt_gpg, gpg_keyring, mock_run):
     ]
 
 
+def test_install_key_from_keyserver_marks_key_installed(apt_gpg, mock_run):
+    apt_gpg.install_key_from_keyserver(key_id="FAKE_KEYID", key_server="key.server")
+
+    assert apt_gpg.is_key_installed(key_id="FAKE_KEYID") is True
+    assert len(mock_run.mock_calls) == 1
+
+
 def test_install_key_from_keyserver_with_apt_key_failure(
     apt_gpg, gpg_keyring, mock_run
 ):